@@ -0,0 +1,118 @@
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+
+access_logger = logging.getLogger("access")
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records carrying an ``access`` dict as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        entry.update(getattr(record, "access", None) or {"message": record.getMessage()})
+        return json.dumps(entry)
+
+
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Route all logging through a queue so handler I/O happens on a listener thread.
+
+    Returns the started listener; stop it on shutdown to flush pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    access_stream = logging.StreamHandler()
+    access_stream.setFormatter(JsonFormatter())
+    access_stream.addFilter(lambda record: record.name == "access")
+    stream.addFilter(lambda record: record.name != "access")
+
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    # uvicorn installs its own synchronous stream handlers with propagate=False; send its records
+    # through the queue too
+    for name in ("uvicorn", "uvicorn.error"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+    # Our JSON record replaces uvicorn's access line; with no handlers uvicorn skips it entirely
+    uvicorn_access = logging.getLogger("uvicorn.access")
+    uvicorn_access.handlers = []
+    uvicorn_access.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream, access_stream, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+class AccessLogMiddleware:
+    """ASGI middleware emitting one structured access record per request.
+
+    Successful GET/HEAD requests are sampled at ``sample_rate``; errors (status
+    >= 400) and requests slower than ``slow_ms`` are always logged.
+    """
+
+    def __init__(self, app, sample_rate: float = 1.0, slow_ms: float = 1000.0):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        state = {"status": 500, "size": 0, "cache": None}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+                for name, value in message.get("headers", []):
+                    if name.lower() == b"x-cache":
+                        state["cache"] = value.decode("latin-1").lower()
+            elif message["type"] == "http.response.body":
+                state["size"] += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(scope, state, (time.perf_counter() - started) * 1000)
+
+    def _sampled_out(self, method: str, status: int, latency_ms: float) -> bool:
+        if status >= 400 or latency_ms >= self.slow_ms or method not in ("GET", "HEAD"):
+            return False
+        return random.random() >= self.sample_rate
+
+    def _log(self, scope, state: dict, latency_ms: float):
+        method = scope.get("method", "")
+        status = state["status"]
+        if self._sampled_out(method, status, latency_ms):
+            return
+        cache: Optional[str] = state["cache"]
+        if cache is None and status == 304:
+            cache = "revalidated"
+        route = scope.get("route")
+        entry = {
+            "method": method,
+            "path": scope.get("path", ""),
+            "route": getattr(route, "path", None),
+            "status": status,
+            "latency_ms": round(latency_ms, 2),
+            "size": state["size"],
+            "cache": cache,
+        }
+        level = logging.ERROR if status >= 500 else logging.WARNING if status >= 400 or latency_ms >= self.slow_ms else logging.INFO
+        access_logger.log(level, "access", extra={"access": entry})
@@ -0,0 +1,132 @@
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List
+
+from pymongo import DeleteMany, ReplaceOne
+
+
+class UnknownAuthor(LookupError):
+    """A bare surname matched no author"""
+
+
+class AmbiguousAuthor(ValueError):
+    """A bare surname matched several authors"""
+
+
+def _fold(value: str) -> str:
+    return unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+
+
+def parse_author(raw: str) -> Dict[str, str]:
+    """Normalize one author, e.g. 'S. K. Ghai' or 'Sanjeev Kumar Ghai' -> key 'ghai-sk', name 'S. K. Ghai'"""
+    tokens = [token for token in re.split(r"[\s.]+", raw.strip()) if token]
+    if not tokens:
+        return {}
+    surname = tokens[-1]
+    initials = [token[0].upper() for part in tokens[:-1] for token in part.split("-") if token]
+    key = "-".join(filter(None, [_fold(surname).lower(), _fold("".join(initials)).lower()]))
+    name = " ".join([f"{initial}." for initial in initials] + [surname])
+    return {"key": key, "name": name}
+
+
+def parse_authors(authors: str) -> List[Dict[str, str]]:
+    """Split a comma/'and'-separated author string into normalized, de-duplicated entities"""
+    parsed = []
+    seen = set()
+    for raw in re.split(r",|\band\b|&", authors or ""):
+        author = parse_author(raw)
+        if author and author["key"] not in seen:
+            seen.add(author["key"])
+            parsed.append(author)
+    return parsed
+
+
+def author_key(value: str) -> str:
+    """Accept either an author key or a display name and return the key"""
+    value = value.strip()
+    if re.fullmatch(r"[a-z0-9'-]+", value):
+        return value
+    return parse_author(value).get("key", "")
+
+
+async def resolve_author_key(db, value: str) -> str:
+    """Resolve a key, display name or bare surname to an author key.
+
+    Raises UnknownAuthor when a surname matches no author and AmbiguousAuthor when it
+    matches several. Keys and full names are returned as given, whether or not they exist.
+    """
+    key = author_key(value)
+    if "-" in key or not key:
+        return key
+    candidates = await db.authors.find(
+        {"key": {"$regex": f"^{re.escape(key)}-[a-z]*$"}}, {"_id": 0, "key": 1}
+    ).to_list(20)
+    if len(candidates) == 1:
+        return candidates[0]["key"]
+    if not candidates:
+        raise UnknownAuthor(f"Unknown author: {value}")
+    raise AmbiguousAuthor(f"Ambiguous author '{value}': {', '.join(sorted(c['key'] for c in candidates))}")
+
+
+def with_author_fields(publication: dict) -> dict:
+    """Add the parsed author list and multikey-indexed author_keys to a publication document"""
+    parsed = parse_authors(publication.get("authors", ""))
+    publication["author_list"] = parsed
+    publication["author_keys"] = [author["key"] for author in parsed]
+    return publication
+
+
+def build_author_index(publications: List[dict]) -> List[dict]:
+    """Precompute one document per author with publication count and weighted coauthor edges"""
+    names = {}
+    counts = defaultdict(int)
+    coauthors = defaultdict(lambda: defaultdict(int))
+    for publication in publications:
+        parsed = publication.get("author_list") or parse_authors(publication.get("authors", ""))
+        for author in parsed:
+            names.setdefault(author["key"], author["name"])
+            counts[author["key"]] += 1
+            for other in parsed:
+                if other["key"] != author["key"]:
+                    coauthors[author["key"]][other["key"]] += 1
+    return [
+        {
+            "key": key,
+            "name": names[key],
+            "publication_count": counts[key],
+            "coauthors": sorted(
+                ({"key": other, "name": names[other], "count": count} for other, count in coauthors[key].items()),
+                key=lambda edge: (-edge["count"], edge["key"]),
+            ),
+        }
+        for key in sorted(counts, key=lambda key: (-counts[key], key))
+    ]
+
+
+async def sync_author_index(db):
+    """Backfill author fields on publications and rebuild the authors collection"""
+    async for publication in db.publications.find({"author_keys": {"$exists": False}}, {"authors": 1}):
+        parsed = with_author_fields({"authors": publication.get("authors", "")})
+        await db.publications.update_one(
+            {"_id": publication["_id"]},
+            {"$set": {"author_list": parsed["author_list"], "author_keys": parsed["author_keys"]}},
+        )
+    publications = await db.publications.find({}, {"_id": 0, "authors": 1, "author_list": 1}).to_list(None)
+    index = {author["key"]: author for author in build_author_index(publications)}
+    existing = {author["key"]: author async for author in db.authors.find({}, {"_id": 0})}
+
+    # Upsert only changed authors and drop stale ones, so readers never see an empty index and
+    # several workers syncing at startup converge on the same documents
+    operations = [
+        ReplaceOne({"key": key}, author, upsert=True)
+        for key, author in index.items()
+        if existing.get(key) != author
+    ]
+    stale = [key for key in existing if key not in index]
+    if stale:
+        operations.append(DeleteMany({"key": {"$in": stale}}))
+    await db.authors.create_index("key", unique=True)
+    if operations:
+        await db.authors.bulk_write(operations, ordered=False)
+    await db.publications.create_index("author_keys")
@@ -0,0 +1,333 @@
+"""Sync the publications collection from the CV PDF.
+
+Usage (from the backend directory):
+    python cv_ingest.py              # skip if the CV is unchanged, else upsert changed entries
+    python cv_ingest.py --force      # re-parse even if the CV hash matches the last ingest
+    python cv_ingest.py --dry-run    # print the parsed publications without touching MongoDB
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import List, Optional
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import InsertOne, UpdateOne
+from pypdf import PdfReader
+
+from authors import parse_authors, sync_author_index, with_author_fields
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+CV_PATH = ROOT_DIR / "CV_Sanjeev_Latest.pdf"
+# Bump whenever parsing changes so the next run re-ingests an unchanged CV
+PARSER_VERSION = 2
+
+# CV section heading -> (publication type, default status); None ends the publication list
+SECTIONS = {
+    "Journal Publications": ("journal", "published"),
+    "Under submission or preparation": ("submitted", "under submission"),
+    "Conference Presentations": ("conference", "published"),
+    "Book Chapters": ("book_chapter", "published"),
+    "Short Courses and Workshops Attended": None,
+}
+
+STATUS_MARKERS = [
+    (re.compile(r"\(?\s*(?:article\s+)?in\s+press\s*\)?", re.IGNORECASE), "in press"),
+    (re.compile(r"\(?\s*to\s+be\s+submitted\s*\)?", re.IGNORECASE), "under submission"),
+]
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+MONTHS = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b|\bpages\b", re.IGNORECASE
+)
+PAGES = re.compile(r"\s+pages?\s+\d+\s*[-–]\s*\d+", re.IGNORECASE)
+# A venue run into the title without a comma, e.g. "... approach 37th International symposium"
+ORDINAL_VENUE = re.compile(r"\s+(?=\d+(?:st|nd|rd|th)\s+[A-Z])")
+NAME_TOKEN = re.compile(r"^(?:[A-Z]\.?|[A-Z][a-z]+\.?|[A-Z][a-z]+-[A-Z][a-z]+)$")
+# Word-level similarity above which a hand-seeded title is taken to be the same publication
+TITLE_MATCH_RATIO = 0.85
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_text(path: Path) -> str:
+    return "\n".join(page.extract_text() or "" for page in PdfReader(str(path)).pages)
+
+
+def _join_lines(lines: List[str]) -> str:
+    """Join wrapped lines, undoing end-of-line hyphenation (short fragments are word breaks)"""
+    text = ""
+    for line in lines:
+        line = line.strip()
+        match = re.search(r"(\w+)-$", text)
+        if match and line[:1].islower() and len(match.group(1)) < 7:
+            text = text[:-1] + line
+        elif text.endswith("-"):
+            text += line
+        else:
+            text = f"{text} {line}" if text else line
+    return re.sub(r"\s+([,.;])", r"\1", re.sub(r"\s+", " ", text)).strip()
+
+
+def split_entries(text: str) -> List[tuple]:
+    """Return (section heading, entry text) for every numbered entry in the publication sections"""
+    entries = []
+    section = None
+    current: List[str] = []
+
+    def flush():
+        if section and current:
+            entries.append((section, _join_lines(current)))
+        current.clear()
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped in SECTIONS:
+            flush()
+            section = stripped if SECTIONS[stripped] else None
+            continue
+        if not section or not stripped or stripped.isdigit():
+            continue  # blank lines and page numbers
+        numbered = re.match(r"^\d+\.\s+(.*)$", stripped)
+        if numbered:
+            flush()
+            current.append(numbered.group(1))
+        elif current:
+            current.append(stripped)
+    flush()
+    return entries
+
+
+def _is_name(segment: str) -> bool:
+    tokens = segment.split()
+    return 1 < len(tokens) <= 5 and all(NAME_TOKEN.match(token) for token in tokens)
+
+
+def _split_authors(entry: str):
+    """Peel author names off the front of an entry; returns (authors, remainder)"""
+    authors = []
+    rest = entry
+    while rest:
+        segment, _, tail = rest.partition(", ")
+        names = [name.strip() for name in segment.split("&") if name.strip()]
+        if names and all(_is_name(name) for name in names):
+            authors.extend(names)
+            rest = tail
+            continue
+        # The last author can be followed by ". Title"; take the longest prefix that is still a name
+        split_at = None
+        for match in re.finditer(r"\.\s+", segment):
+            names = [name.strip() for name in segment[:match.start()].split("&") if name.strip()]
+            if names and all(_is_name(name) for name in names):
+                split_at = match
+        if split_at:
+            authors.extend(name.strip() for name in segment[:split_at.start()].split("&") if name.strip())
+            rest = rest[split_at.end():]
+        break
+    return authors, rest
+
+
+def _is_detail(segment: str) -> bool:
+    """Volume, pages, year and similar trailing citation fields"""
+    segment = segment.strip(" .")
+    return not segment or bool(re.match(r"^[\d(]", segment)) or bool(YEAR.search(segment)) or segment.startswith("http")
+
+
+def _is_date(segment: str) -> bool:
+    """Dates and page ranges in conference and chapter entries, e.g. 'February 26-28' or '11-37'"""
+    return not re.sub(r"[\W\d_]+", "", MONTHS.sub("", segment))
+
+
+def parse_entry(section: str, entry: str) -> Optional[dict]:
+    """Parse one CV entry; ``year`` is None when the entry has none (e.g. in preparation)"""
+    pub_type, status = SECTIONS[section]
+    year_matches = [match.group(0) for match in YEAR.finditer(entry)]
+    for pattern, marker_status in STATUS_MARKERS:
+        if pattern.search(entry):
+            status = marker_status
+            entry = pattern.sub("", entry)
+    entry = re.sub(r"\.\s+(?=(?:19|20)\d{2}\b)", ", ", entry).replace(";", ",")
+
+    authors, rest = _split_authors(entry)
+    if not authors or not rest:
+        return None
+    segments = [segment.strip() for segment in rest.split(", ")]
+
+    if pub_type in ("journal", "submitted"):
+        while segments and _is_detail(segments[-1]) and len(segments) > 1:
+            segments.pop()
+        last = segments.pop().strip(" .")
+        title, _, venue = last.rpartition(". ")
+        if not title:
+            # Without a ". " separator the venue is the last comma-separated segment, if any
+            title, venue = (", ".join(segments), last) if segments else (last, "")
+        elif segments:
+            title = ", ".join(segments + [title])
+    else:
+        title, *venue_parts = ORDINAL_VENUE.split(PAGES.sub("", segments[0]), maxsplit=1)
+        venue = ", ".join(venue_parts + [
+            re.sub(r"^published in\s+", "", segment.strip(" ."), flags=re.IGNORECASE)
+            for segment in segments[1:]
+            if not _is_date(segment) and not re.fullmatch(r"\w+ \(\d{4}\)\.?", segment)
+        ])
+
+    return {
+        "title": title.strip(" ."),
+        "authors": ", ".join(author["name"] for author in parse_authors(", ".join(authors))),
+        "journal": venue.strip(" .") or None,
+        "year": int(year_matches[-1]) if year_matches else None,
+        "type": pub_type,
+        "status": status,
+    }
+
+
+def parse_cv(path: Path) -> List[dict]:
+    publications = []
+    for section, entry in split_entries(extract_text(path)):
+        publication = parse_entry(section, entry)
+        if publication:
+            publications.append(publication)
+    return publications
+
+
+def title_key(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", title.lower()).strip()
+
+
+def entry_key(publication: dict) -> str:
+    """Identity of a publication across CV revisions: its type and normalized title"""
+    return f"{publication['type']}:{title_key(publication['title'])}"
+
+
+def title_similarity(first: str, second: str) -> float:
+    """1.0 for equal titles, 0.95 when one is a shortened form of the other, else the word-level ratio"""
+    first_words, second_words = title_key(first).split(), title_key(second).split()
+    if first_words == second_words:
+        return 1.0
+    shorter, longer = sorted((first_words, second_words), key=len)
+    if len(shorter) >= 6 and longer[:len(shorter)] == shorter:
+        return 0.95
+    return SequenceMatcher(None, first_words, second_words).ratio()
+
+
+def _adopt_legacy(parsed: dict, existing: dict, legacy: List[dict]):
+    """Pair hand-seeded documents with CV entries, best match first; returns the unmatched ones"""
+    candidates = []
+    for key, publication in parsed.items():
+        if key in existing:
+            continue
+        for index, doc in enumerate(legacy):
+            score = title_similarity(doc.get("title", ""), publication["title"])
+            if score >= TITLE_MATCH_RATIO:
+                # Prefer a document of the same type, then any type (e.g. a submission seeded as a journal)
+                candidates.append((doc.get("type") == publication["type"], score, key, index))
+    adopted = set()
+    for _, _, key, index in sorted(candidates, reverse=True):
+        if key not in existing and index not in adopted:
+            existing[key] = legacy[index]
+            adopted.add(index)
+    return [doc for index, doc in enumerate(legacy) if index not in adopted]
+
+
+def content_hash(publication: dict) -> str:
+    fields = {field: publication.get(field) for field in ("title", "authors", "journal", "year", "type", "status")}
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+async def ingest(db, path: Path = CV_PATH, force: bool = False) -> dict:
+    """Upsert publications that changed since the last ingest; returns a summary"""
+    cv_hash = file_sha256(path)
+    state = await db.ingest_state.find_one({"_id": "cv"})
+    unchanged = state and state.get("sha256") == cv_hash and state.get("parser_version") == PARSER_VERSION
+    # The collection may have been wiped and reseeded since; only skip if the CV entries are still there
+    if unchanged and not force and await db.publications.find_one({"source": "cv"}, {"_id": 1}):
+        return {"skipped": True, "sha256": cv_hash}
+
+    parsed = {}
+    for publication in parse_cv(path):
+        parsed.setdefault(entry_key(publication), publication)
+
+    existing = {}
+    legacy = []  # hand-seeded documents, adopted by title the first time the CV is ingested
+    async for doc in db.publications.find({}, {"title": 1, "type": 1, "year": 1, "cv_key": 1, "content_hash": 1, "source": 1}):
+        if doc.get("cv_key"):
+            existing[doc["cv_key"]] = doc
+        else:
+            legacy.append(doc)
+    # The CV is the source of truth: seeded documents with no CV counterpart are retired
+    unmatched = _adopt_legacy(parsed, existing, legacy)
+
+    operations = []
+    seen = set(parsed)
+    for key, publication in parsed.items():
+        current = existing.get(key)
+        if publication["year"] is None:
+            # Undated entries keep the year already on the site; new ones get the current year
+            publication["year"] = (current or {}).get("year") or datetime.now(timezone.utc).year
+        digest = content_hash(publication)
+        if current and current.get("content_hash") == digest:
+            continue
+        document = with_author_fields(dict(publication, cv_key=key, content_hash=digest, source="cv"))
+        if current:
+            operations.append(UpdateOne({"_id": current["_id"]}, {"$set": document}))
+        else:
+            operations.append(InsertOne(document))
+
+    # Entries that came from an earlier CV but are gone from this one
+    removed = [doc["_id"] for key, doc in existing.items() if doc.get("source") == "cv" and key not in seen]
+    removed += [doc["_id"] for doc in unmatched]
+
+    if operations:
+        await db.publications.bulk_write(operations, ordered=False)
+    if removed:
+        await db.publications.delete_many({"_id": {"$in": removed}})
+    if operations or removed:
+        await sync_author_index(db)
+    await db.publications.create_index("cv_key")
+    await db.ingest_state.update_one(
+        {"_id": "cv"},
+        {"$set": {"sha256": cv_hash, "parser_version": PARSER_VERSION, "ingested_at": datetime.now(timezone.utc), "count": len(seen)}},
+        upsert=True,
+    )
+    return {"skipped": False, "sha256": cv_hash, "parsed": len(seen), "upserted": len(operations), "removed": len(removed),
+            "retired": [doc.get("title", "") for doc in unmatched]}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Sync publications from the CV PDF")
+    parser.add_argument("--pdf", type=Path, default=CV_PATH)
+    parser.add_argument("--force", action="store_true", help="ignore the stored CV hash")
+    parser.add_argument("--dry-run", action="store_true", help="print parsed publications and exit")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        print(json.dumps(parse_cv(args.pdf), indent=2, ensure_ascii=False))
+        return
+
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    summary = await ingest(db, args.pdf, args.force)
+    if summary["skipped"]:
+        print(f"CV unchanged ({summary['sha256'][:12]}), nothing to do.")
+    else:
+        print(f"Parsed {summary['parsed']} publications: {summary['upserted']} upserted, {summary['removed']} removed.")
+        for title in summary["retired"]:
+            print(f"  removed seeded publication not in the CV: {title}")
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
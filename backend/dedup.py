@@ -0,0 +1,51 @@
+import hashlib
+import re
+import time
+
+
+def contact_fingerprint(email: str, subject: str, message: str) -> bytes:
+    """Hash of the normalized submission content (case and whitespace insensitive)"""
+    parts = [re.sub(r"\s+", " ", part).strip().lower() for part in (email, subject, message)]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).digest()[:16]
+
+
+class RotatingFingerprintSet:
+    """Time-windowed membership set built from two rotating generations.
+
+    A fingerprint is remembered for at least ``window`` seconds and at most two
+    windows. Each generation is capped at ``max_size`` entries; reaching the cap
+    rotates early, so memory stays bounded during a flood of distinct payloads.
+    """
+
+    def __init__(self, window: float = 3600.0, max_size: int = 100_000):
+        self.window = window
+        self.max_size = max_size
+        self._current = set()
+        self._previous = set()
+        self._rotated_at = time.monotonic()
+
+    def _rotate_if_due(self):
+        now = time.monotonic()
+        if now - self._rotated_at >= 2 * self.window:
+            self._previous = set()
+            self._current = set()
+            self._rotated_at = now
+        elif now - self._rotated_at >= self.window or len(self._current) >= self.max_size:
+            self._previous = self._current
+            self._current = set()
+            self._rotated_at = now
+
+    def check_and_add(self, fingerprint: bytes) -> bool:
+        """Record the fingerprint; returns True if it was already seen in the window"""
+        self._rotate_if_due()
+        if fingerprint in self._current or fingerprint in self._previous:
+            return True
+        self._current.add(fingerprint)
+        return False
+
+    def discard(self, fingerprint: bytes):
+        self._current.discard(fingerprint)
+        self._previous.discard(fingerprint)
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
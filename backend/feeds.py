@@ -0,0 +1,116 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import List
+from xml.sax.saxutils import escape
+import hashlib
+import json
+
+
+SITE_TITLE = "Dr. Sanjeev Kumar Ghai - News"
+SITE_AUTHOR = "Sanjeev Kumar Ghai"
+
+
+def _parse_date(value) -> datetime:
+    """Turn a stored news date into an aware datetime (UTC if no zone given)"""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value))
+        except ValueError:
+            parsed = datetime(1970, 1, 1)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    # pymongo decodes with bson's FixedOffset; email.utils needs timezone.utc for GMT output
+    return parsed.astimezone(timezone.utc)
+
+
+def _entry_id(site_url: str, item: dict) -> str:
+    digest = hashlib.sha1(f"{item.get('date')}|{item.get('title')}".encode("utf-8")).hexdigest()
+    return f"{site_url}/#news-{digest[:16]}"
+
+
+def news_fingerprint(news_items: List[dict]) -> str:
+    """Stable hash of the news content, used as the feed ETag"""
+    payload = json.dumps(news_items, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+async def record_fingerprint(collection, fingerprint: str) -> datetime:
+    """Return when the feed content last changed, shared by all instances through ``collection``.
+
+    The stored time moves only when the fingerprint differs, so Last-Modified stays
+    the same across restarts and instances for unchanged content.
+    """
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    await collection.update_one(
+        {"_id": "news", "fingerprint": {"$ne": fingerprint}},
+        {"$set": {"fingerprint": fingerprint, "changed_at": now}},
+    )
+    await collection.update_one(
+        {"_id": "news"}, {"$setOnInsert": {"fingerprint": fingerprint, "changed_at": now}}, upsert=True
+    )
+    state = await collection.find_one({"_id": "news"})
+    return _parse_date(state["changed_at"])
+
+
+def last_updated(news_items: List[dict]) -> datetime:
+    if not news_items:
+        return datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return max(_parse_date(item.get("date")) for item in news_items)
+
+
+def build_atom(news_items: List[dict], site_url: str, feed_url: str) -> str:
+    updated = last_updated(news_items).isoformat()
+    entries = []
+    for item in news_items:
+        entries.append(
+            "  <entry>\n"
+            f"    <title>{escape(item.get('title', ''))}</title>\n"
+            f"    <id>{escape(_entry_id(site_url, item))}</id>\n"
+            f"    <link href=\"{escape(site_url)}/#news\"/>\n"
+            f"    <updated>{_parse_date(item.get('date')).isoformat()}</updated>\n"
+            f"    <category term=\"{escape(item.get('category', ''))}\"/>\n"
+            f"    <summary>{escape(item.get('content', ''))}</summary>\n"
+            "  </entry>\n"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        f"  <title>{escape(SITE_TITLE)}</title>\n"
+        f"  <id>{escape(feed_url)}</id>\n"
+        f"  <link href=\"{escape(site_url)}\"/>\n"
+        f"  <link rel=\"self\" href=\"{escape(feed_url)}\"/>\n"
+        f"  <updated>{updated}</updated>\n"
+        f"  <author><name>{escape(SITE_AUTHOR)}</name></author>\n"
+        + "".join(entries)
+        + "</feed>\n"
+    )
+
+
+def build_rss(news_items: List[dict], site_url: str, feed_url: str) -> str:
+    items = []
+    for item in news_items:
+        items.append(
+            "    <item>\n"
+            f"      <title>{escape(item.get('title', ''))}</title>\n"
+            f"      <link>{escape(site_url)}/#news</link>\n"
+            f"      <guid isPermaLink=\"false\">{escape(_entry_id(site_url, item))}</guid>\n"
+            f"      <pubDate>{format_datetime(_parse_date(item.get('date')))}</pubDate>\n"
+            f"      <category>{escape(item.get('category', ''))}</category>\n"
+            f"      <description>{escape(item.get('content', ''))}</description>\n"
+            "    </item>\n"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">\n'
+        "  <channel>\n"
+        f"    <title>{escape(SITE_TITLE)}</title>\n"
+        f"    <link>{escape(site_url)}</link>\n"
+        f"    <atom:link href=\"{escape(feed_url)}\" rel=\"self\" type=\"application/rss+xml\"/>\n"
+        "    <description>News and updates</description>\n"
+        f"    <lastBuildDate>{format_datetime(last_updated(news_items))}</lastBuildDate>\n"
+        + "".join(items)
+        + "  </channel>\n"
+        "</rss>\n"
+    )
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import os
+import smtplib
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from typing import List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+DEAD = "dead"
+
+
+class NotificationOutbox:
+    """Delivers contact-form notifications in the background.
+
+    The delivery state is a ``notification`` subdocument on the contact message
+    itself, so storing a message and queuing its notification is a single atomic
+    insert. Worker tasks claim batches of due messages, send them over one SMTP
+    connection per batch and reschedule failures with exponential backoff until
+    they are moved to the dead-letter state. Sent and dead messages keep only
+    their final status, so nothing accumulates beyond the messages themselves.
+    """
+
+    def __init__(self, collection, smtp_host: str, smtp_port: int = 25, sender: str = "",
+                 recipient: str = "", username: Optional[str] = None, password: Optional[str] = None,
+                 starttls: bool = False, workers: int = 2, batch_size: int = 20, max_attempts: int = 6,
+                 base_delay: float = 30.0, max_delay: float = 3600.0, poll_interval: float = 30.0,
+                 lease_seconds: float = 300.0):
+        self.collection = collection
+        self.smtp_host = smtp_host
+        self.smtp_port = smtp_port
+        self.sender = sender
+        self.recipient = recipient
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def from_env(cls, collection) -> Optional["NotificationOutbox"]:
+        """Build from environment variables, or return None when SMTP is not configured"""
+        smtp_host = os.environ.get("SMTP_HOST")
+        recipient = os.environ.get("NOTIFY_EMAIL_TO")
+        if not smtp_host or not recipient:
+            return None
+        return cls(
+            collection,
+            smtp_host=smtp_host,
+            smtp_port=int(os.environ.get("SMTP_PORT", "587")),
+            sender=os.environ.get("NOTIFY_EMAIL_FROM", recipient),
+            recipient=recipient,
+            username=os.environ.get("SMTP_USER"),
+            password=os.environ.get("SMTP_PASSWORD"),
+            starttls=os.environ.get("SMTP_STARTTLS", "true").lower() == "true",
+            workers=int(os.environ.get("NOTIFY_WORKERS", "2")),
+            batch_size=int(os.environ.get("NOTIFY_BATCH_SIZE", "20")),
+            max_attempts=int(os.environ.get("NOTIFY_MAX_ATTEMPTS", "6")),
+        )
+
+    def start(self):
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._run(), name=f"notification-worker-{index}"))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        """Wake the workers after a new outbox entry was written"""
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                delivered = await self.process_batch()
+            except Exception as e:
+                logger.error(f"Notification worker error: {str(e)}")
+                delivered = 0
+            if delivered:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def _claim_batch(self) -> List[dict]:
+        now = datetime.now(timezone.utc)
+        due = {"$or": [
+            {"notification.status": PENDING, "notification.next_attempt_at": {"$lte": now}},
+            {"notification.status": SENDING, "notification.lease_expires_at": {"$lte": now}},
+        ]}
+        batch = []
+        while len(batch) < self.batch_size:
+            entry = await self.collection.find_one_and_update(
+                due,
+                {"$set": {"notification.status": SENDING,
+                          "notification.lease_expires_at": now + timedelta(seconds=self.lease_seconds)}},
+                sort=[("notification.next_attempt_at", 1)],
+            )
+            if entry is None:
+                break
+            batch.append(entry)
+        return batch
+
+    async def process_batch(self) -> int:
+        """Claim and deliver one batch of due entries; returns how many were claimed"""
+        batch = await self._claim_batch()
+        if not batch:
+            return 0
+        results = await asyncio.to_thread(self._send_batch, batch)
+        for entry, error in zip(batch, results):
+            if error is None:
+                await self.collection.update_one(
+                    {"_id": entry["_id"]},
+                    {"$set": {"notification.status": SENT, "notification.sent_at": datetime.now(timezone.utc)},
+                     "$unset": {"notification.lease_expires_at": "", "notification.next_attempt_at": ""}},
+                )
+            else:
+                await self._reschedule(entry, error)
+        return len(batch)
+
+    async def _reschedule(self, entry: dict, error: str):
+        attempts = entry["notification"].get("attempts", 0) + 1
+        update = {"notification.attempts": attempts, "notification.last_error": error}
+        unset = {"notification.lease_expires_at": ""}
+        if attempts >= self.max_attempts:
+            update["notification.status"] = DEAD
+            unset["notification.next_attempt_at"] = ""
+            logger.warning(f"Notification {entry['_id']} moved to dead letter after {attempts} attempts: {error}")
+        else:
+            delay = min(self.base_delay * (2 ** (attempts - 1)), self.max_delay)
+            update["notification.status"] = PENDING
+            update["notification.next_attempt_at"] = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        await self.collection.update_one({"_id": entry["_id"]}, {"$set": update, "$unset": unset})
+
+    def _build_message(self, contact: dict) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = self.recipient
+        message["Reply-To"] = contact["email"]
+        message["Subject"] = f"[Website contact] {contact['subject']}"
+        message.set_content(
+            f"From: {contact['name']} <{contact['email']}>\n"
+            f"Received: {contact['timestamp']}\n\n"
+            f"{contact['message']}\n"
+        )
+        return message
+
+    def _send_batch(self, batch: List[dict]) -> List[Optional[str]]:
+        """Send a batch over one SMTP connection (runs in a worker thread)"""
+        try:
+            smtp = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=30)
+        except (OSError, smtplib.SMTPException) as e:
+            return [f"connect: {str(e)}"] * len(batch)
+        results = []
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or "")
+            for entry in batch:
+                try:
+                    smtp.send_message(self._build_message(entry))
+                    results.append(None)
+                except (OSError, smtplib.SMTPException) as e:
+                    results.append(str(e))
+        except (OSError, smtplib.SMTPException) as e:
+            results.extend([str(e)] * (len(batch) - len(results)))
+        finally:
+            try:
+                smtp.quit()
+            except (OSError, smtplib.SMTPException):
+                smtp.close()
+        return results
+
+
+def pending_notification() -> dict:
+    """Initial delivery state, stored as the ``notification`` field of a new contact message"""
+    return {"status": PENDING, "attempts": 0, "next_attempt_at": datetime.now(timezone.utc)}
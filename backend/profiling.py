@@ -0,0 +1,130 @@
+import asyncio
+import cProfile
+import hmac
+import io
+import logging
+import pstats
+import random
+import time
+import uuid
+from pathlib import Path
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that runs selected requests under cProfile.
+
+    A request is profiled when it carries ``X-Profile-Token`` matching the
+    configured admin token, or when it is picked by background sampling at
+    ``sample_rate``. With ``X-Profile-Output: inline`` the pstats report replaces
+    the response body; otherwise the profile is written to ``output_dir`` and its
+    id is returned in ``X-Profile-Id``. Other requests pass straight through.
+
+    cProfile hooks the whole thread, not one task: while the profiled request
+    awaits I/O, coroutines of concurrent requests that run on the event loop are
+    included in its profile. Profile on a quiet instance, or read the report as
+    "what the process did during this request".
+    """
+
+    def __init__(self, app, token: Optional[str] = None, sample_rate: float = 0.0,
+                 output_dir: Optional[Path] = None, keep: int = 50, top: int = 40):
+        self.app = app
+        self.token = token.encode("latin-1") if token else None
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self.keep = keep
+        self.top = top
+        # Only one profiler can be active per thread
+        self._lock = asyncio.Lock()
+
+    def _authorized(self, scope) -> bool:
+        if not self.token:
+            return False
+        for name, value in scope.get("headers", []):
+            if name == b"x-profile-token":
+                return hmac.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = self._authorized(scope)
+        sampled = (not requested and self.sample_rate > 0 and self.output_dir is not None
+                   and not self._lock.locked() and random.random() < self.sample_rate)
+        if not requested and not sampled:
+            await self.app(scope, receive, send)
+            return
+
+        inline = requested and (b"x-profile-output", b"inline") in scope.get("headers", [])
+        if inline:
+            await self._profile_inline(scope, receive, send)
+        else:
+            await self._profile_stored(scope, receive, send)
+
+    async def _profile_inline(self, scope, receive, send):
+        state = {"status": 500}
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+
+        async with self._lock:
+            profiler = cProfile.Profile()
+            started = time.perf_counter()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, capture)
+            finally:
+                profiler.disable()
+            elapsed = time.perf_counter() - started
+
+        report = self._report(profiler, scope, elapsed, state["status"]).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(report)).encode("latin-1"))],
+        })
+        await send({"type": "http.response.body", "body": report})
+
+    async def _profile_stored(self, scope, receive, send):
+        profile_id = f"{int(time.time())}-{scope['path'].strip('/').replace('/', '_') or 'root'}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start" and self.output_dir is not None:
+                message = dict(message, headers=list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode("latin-1"))])
+            await send(message)
+
+        async with self._lock:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                await self.app(scope, receive, send_with_id)
+            finally:
+                profiler.disable()
+
+        if self.output_dir is not None:
+            await asyncio.to_thread(self._store, profiler, profile_id)
+
+    def _report(self, profiler: cProfile.Profile, scope, elapsed: float, status: int) -> str:
+        stream = io.StringIO()
+        stream.write(f"{scope['method']} {scope['path']} -> {status} in {elapsed * 1000:.1f} ms\n\n")
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(self.top)
+        return stream.getvalue()
+
+    def _store(self, profiler: cProfile.Profile, profile_id: str):
+        """Write the profile and prune old ones (runs in a worker thread)"""
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self.output_dir / f"{profile_id}.prof"))
+            stored = sorted(self.output_dir.glob("*.prof"), key=lambda path: path.stat().st_mtime)
+            for old in stored[:-self.keep]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not store profile {profile_id}: {str(e)}")
@@ -3,6 +3,9 @@ from motor.motor_asyncio import AsyncIOMotorClient
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+from datetime import datetime, timezone
+
+from authors import sync_author_index, with_author_fields
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -16,6 +19,8 @@ async def seed_database():
     await db.publications.delete_many({})
     await db.news.delete_many({})
     await db.profile.delete_many({})
+    # The hand-written publications replace any CV ingest, so the next cv_ingest run must not skip
+    await db.ingest_state.delete_one({"_id": "cv"})
     
     # Seed profile
     profile = {
@@ -181,37 +186,40 @@ async def seed_database():
         }
     ]
     
-    await db.publications.insert_many(publications)
+    await db.publications.insert_many([with_author_fields(pub) for pub in publications])
+    await sync_author_index(db)
     
     # Seed news
     news = [
         {
             "title": "Joined University of Cambridge",
             "content": "Started as Research Associate at the Department of Engineering, University of Cambridge, working on analyzing large-scale CFD datasets for Rolls-Royce.",
-            "date": "2024-04-01",
+            "date": datetime(2024, 4, 1, tzinfo=timezone.utc),
             "category": "career"
         },
         {
             "title": "Award at UKCTRF 2022",
             "content": "Won 2nd Prize in audio-visual category at the UK Combustion and Turbulent Reacting Flow Conference.",
-            "date": "2022-09-15",
+            "date": datetime(2022, 9, 15, tzinfo=timezone.utc),
             "category": "award"
         },
         {
             "title": "Global Talent Endorsement",
             "content": "Received Global Talent Endorsement from UKRI, recognizing exceptional promise in research and innovation.",
-            "date": "2021-11-20",
+            "date": datetime(2021, 11, 20, tzinfo=timezone.utc),
             "category": "award"
         },
         {
             "title": "New Publication in Physics of Fluids",
             "content": "Published research on entropy generation during head-on interaction of premixed flames with inert walls.",
-            "date": "2023-06-10",
+            "date": datetime(2023, 6, 10, tzinfo=timezone.utc),
             "category": "publication"
         }
     ]
     
     await db.news.insert_many(news)
+    await db.news.create_index([("date", -1), ("_id", -1)])
+    await db.news.create_index([("category", 1), ("date", -1), ("_id", -1)])
     
     print("Database seeded successfully!")
     client.close()
@@ -1,14 +1,29 @@
-from fastapi import FastAPI, APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Request, Query
+from fastapi.responses import FileResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from bson import ObjectId
+from bson.errors import InvalidId
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
 from typing import List, Optional
 from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import asyncio
+import base64
+import hashlib
+import json
+import time
+
+from feeds import build_atom, build_rss, news_fingerprint, record_fingerprint
+from notifications import NotificationOutbox, pending_notification
+from profiling import ProfilingMiddleware
+from access_log import AccessLogMiddleware, setup_logging
+from dedup import RotatingFingerprintSet, contact_fingerprint
+from authors import AmbiguousAuthor, UnknownAuthor, resolve_author_key, sync_author_index, with_author_fields
 
 
 ROOT_DIR = Path(__file__).parent
@@ -20,10 +35,22 @@ client = AsyncIOMotorClient(
     mongo_url,
     tls=True,
     tlsAllowInvalidCertificates=True,
-    serverSelectionTimeoutMS=5000
+    serverSelectionTimeoutMS=5000,
+    tz_aware=True,
+    tzinfo=timezone.utc
 )
 db = client[os.environ['DB_NAME']]
 
+# Contact notifications are delivered from contact_messages by background workers (disabled without SMTP settings)
+notification_outbox = NotificationOutbox.from_env(db.contact_messages)
+
+SITE_URL = os.environ.get('SITE_URL', 'https://sanjeevghai.github.io').rstrip('/')
+FEED_REVALIDATE_SECONDS = float(os.environ.get('FEED_REVALIDATE_SECONDS', '300'))
+BOOTSTRAP_MAX_AGE = int(os.environ.get('BOOTSTRAP_MAX_AGE', '60'))
+CONTACT_DEDUP_WINDOW_SECONDS = float(os.environ.get('CONTACT_DEDUP_WINDOW_SECONDS', '3600'))
+NEWS_PAGE_SIZE = 20
+NEWS_MAX_PAGE_SIZE = 100
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -42,13 +69,14 @@ class Publication(BaseModel):
     type: str  # journal, conference, book_chapter, submitted
     link: Optional[str] = None
     status: Optional[str] = None
+    author_keys: List[str] = []
 
 class NewsItem(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
     title: str
     content: str
-    date: str
+    date: datetime
     category: str
 
 class ContactMessage(BaseModel):
@@ -58,6 +86,21 @@ class ContactMessage(BaseModel):
     message: str
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
+class Author(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    
+    key: str
+    name: str
+    publication_count: int
+
+class Coauthor(BaseModel):
+    key: str
+    name: str
+    count: int
+
+class AuthorDetail(Author):
+    coauthors: List[Coauthor]
+
 class ProfileData(BaseModel):
     model_config = ConfigDict(extra="ignore")
     
@@ -105,26 +148,227 @@ async def get_profile():
     return profile
 
 @api_router.get("/publications", response_model=List[Publication])
-async def get_publications(year: Optional[int] = None, type: Optional[str] = None):
+async def get_publications(year: Optional[int] = None, type: Optional[str] = None, author: Optional[str] = None):
     query = {}
     if year:
         query["year"] = year
     if type:
         query["type"] = type
+    if author:
+        key = await _resolve_author(author)
+        if key is None:
+            return []
+        # Multikey index lookup on the normalized author keys
+        query["author_keys"] = key
     
     publications = await db.publications.find(query, {"_id": 0}).to_list(1000)
     return publications
 
+async def _resolve_author(value: str) -> Optional[str]:
+    """Author key for a key, name or surname; None when no author matches, 400 when several do"""
+    try:
+        return await resolve_author_key(db, value)
+    except UnknownAuthor:
+        return None
+    except AmbiguousAuthor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@api_router.get("/authors", response_model=List[Author])
+async def get_authors():
+    authors = await db.authors.find({}, {"_id": 0, "coauthors": 0}).sort([("publication_count", -1), ("key", 1)]).to_list(1000)
+    return authors
+
+@api_router.get("/authors/{key}", response_model=AuthorDetail)
+async def get_author(key: str):
+    resolved = await _resolve_author(key)
+    author = await db.authors.find_one({"key": resolved}, {"_id": 0}) if resolved else None
+    if not author:
+        raise HTTPException(status_code=404, detail="Author not found")
+    return author
+
+def _encode_news_cursor(item: dict) -> str:
+    raw = f"{item['date'].isoformat()}|{item['_id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def _decode_news_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        date, _, object_id = raw.partition("|")
+        return datetime.fromisoformat(date), ObjectId(object_id)
+    except (ValueError, InvalidId, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def _query_news(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    category: Optional[str] = None,
+    limit: int = NEWS_PAGE_SIZE,
+    cursor: Optional[str] = None,
+):
+    """Newest-first page of news plus the cursor for the next page (None on the last page)"""
+    query = {}
+    if since or until:
+        query["date"] = {}
+        if since:
+            query["date"]["$gte"] = since
+        if until:
+            query["date"]["$lt"] = until
+    if category:
+        query["category"] = category
+    if cursor:
+        date, object_id = _decode_news_cursor(cursor)
+        keyset = {"$or": [{"date": {"$lt": date}}, {"date": date, "_id": {"$lt": object_id}}]}
+        query = {"$and": [query, keyset]} if query else keyset
+    
+    # Fetch one extra document to know whether another page exists
+    news_items = await db.news.find(query).sort([("date", -1), ("_id", -1)]).to_list(limit + 1)
+    next_cursor = _encode_news_cursor(news_items[limit - 1]) if len(news_items) > limit else None
+    news_items = news_items[:limit]
+    for item in news_items:
+        item.pop("_id", None)
+    return news_items, next_cursor
+
 @api_router.get("/news", response_model=List[NewsItem])
-async def get_news():
-    news_items = await db.news.find({}, {"_id": 0}).sort("date", -1).to_list(100)
+async def get_news(
+    request: Request,
+    response: Response,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    category: Optional[str] = None,
+    limit: int = Query(NEWS_PAGE_SIZE, ge=1, le=NEWS_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    news_items, next_cursor = await _query_news(since, until, category, limit, cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
     return news_items
 
+# Rendered feed documents, rebuilt only when the news content changes
+_feed_cache = {"etag": None, "last_modified": None, "checked_at": None, "documents": {}}
+_feed_lock = asyncio.Lock()
+
+def invalidate_news_feed():
+    _feed_cache["checked_at"] = None
+
+def _feed_cache_fresh() -> bool:
+    checked_at = _feed_cache["checked_at"]
+    return checked_at is not None and time.monotonic() - checked_at < FEED_REVALIDATE_SECONDS
+
+async def _load_feed_cache():
+    if _feed_cache_fresh():
+        return _feed_cache
+    async with _feed_lock:
+        if _feed_cache_fresh():
+            return _feed_cache
+        news_items, _ = await _query_news(limit=NEWS_MAX_PAGE_SIZE)
+        fingerprint = news_fingerprint(news_items)
+        if fingerprint != _feed_cache["etag"]:
+            _feed_cache["etag"] = fingerprint
+            # Time of the content change as stored in Mongo, so restarts and other instances agree
+            _feed_cache["last_modified"] = await record_fingerprint(db.feed_state, fingerprint)
+            _feed_cache["news"] = news_items
+            _feed_cache["documents"] = {}
+        _feed_cache["checked_at"] = time.monotonic()
+    return _feed_cache
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return f'"{etag}"' in candidates or "*" in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+async def _feed_response(request: Request, kind: str, media_type: str, builder):
+    cache = await _load_feed_cache()
+    headers = {
+        "ETag": f'"{cache["etag"]}-{kind}"',
+        "Last-Modified": format_datetime(cache["last_modified"], usegmt=True),
+        "Cache-Control": f"public, max-age={int(FEED_REVALIDATE_SECONDS)}",
+    }
+    if _not_modified(request, f'{cache["etag"]}-{kind}', cache["last_modified"]):
+        return Response(status_code=304, headers=headers)
+    document = cache["documents"].get(kind)
+    headers["X-Cache"] = "HIT"
+    if document is None:
+        document = builder(cache["news"], SITE_URL, str(request.url.replace(query="")))
+        cache["documents"][kind] = document
+        headers["X-Cache"] = "MISS"
+    return Response(content=document, media_type=media_type, headers=headers)
+
+@api_router.get("/news/feed.atom")
+async def get_news_atom(request: Request):
+    return await _feed_response(request, "atom", "application/atom+xml", build_atom)
+
+@api_router.get("/news/feed.rss")
+async def get_news_rss(request: Request):
+    return await _feed_response(request, "rss", "application/rss+xml", build_rss)
+
+BOOTSTRAP_SECTIONS = ("profile", "publications", "news")
+
+@api_router.get("/bootstrap")
+async def get_bootstrap(request: Request, sections: Optional[str] = None):
+    """Profile, publications and news in one round trip, fetched concurrently"""
+    requested = BOOTSTRAP_SECTIONS
+    if sections is not None:
+        requested = tuple(dict.fromkeys(section.strip() for section in sections.split(",") if section.strip()))
+        unknown = [section for section in requested if section not in BOOTSTRAP_SECTIONS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown sections: {', '.join(unknown)}")
+        if not requested:
+            raise HTTPException(status_code=400, detail="No sections selected")
+    
+    fetchers = {
+        "profile": get_profile,
+        "publications": lambda: get_publications(year=None, type=None, author=None),
+        "news": _query_news,
+    }
+    results = await asyncio.gather(*(fetchers[section]() for section in requested))
+    payload = dict(zip(requested, results))
+    if "publications" in payload:
+        payload["publications"] = [Publication(**pub).model_dump() for pub in payload["publications"]]
+    if "news" in payload:
+        news_items, payload["news_next_cursor"] = payload["news"]
+        payload["news"] = [NewsItem(**item).model_dump(mode="json") for item in news_items]
+    
+    body = json.dumps(payload, default=str).encode("utf-8")
+    etag = hashlib.sha256(body).hexdigest()
+    headers = {"ETag": f'"{etag}"', "Cache-Control": f"public, max-age={BOOTSTRAP_MAX_AGE}"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+_recent_contacts = RotatingFingerprintSet(window=CONTACT_DEDUP_WINDOW_SECONDS)
+
 @api_router.post("/contact")
 async def submit_contact(message: ContactMessage):
+    response = {"success": True, "message": "Thank you for your message. I'll get back to you soon!"}
+    # Replayed submissions are acknowledged without touching the database
+    fingerprint = contact_fingerprint(message.email, message.subject, message.message)
+    if _recent_contacts.check_and_add(fingerprint):
+        return response
+    
     message_dict = message.model_dump()
-    await db.contact_messages.insert_one(message_dict)
-    return {"success": True, "message": "Thank you for your message. I'll get back to you soon!"}
+    if notification_outbox:
+        # The delivery state is part of the message, so storing and queuing it is one atomic write.
+        # Without SMTP settings nothing is queued, and enabling them later does not mail old messages.
+        message_dict["notification"] = pending_notification()
+    try:
+        await db.contact_messages.insert_one(message_dict)
+    except Exception:
+        # Nothing was stored, so let the client's retry through
+        _recent_contacts.discard(fingerprint)
+        raise
+    if notification_outbox:
+        notification_outbox.notify()
+    return response
 
 @api_router.get("/cv")
 async def download_cv():
@@ -145,6 +389,8 @@ async def seed_database():
         await db.publications.delete_many({})
         await db.news.delete_many({})
         await db.profile.delete_many({})
+        # The hand-written publications replace any CV ingest, so the next cv_ingest run must not skip
+        await db.ingest_state.delete_one({"_id": "cv"})
         
         # Seed profile
         profile = {
@@ -335,25 +581,43 @@ async def seed_database():
 ]
 
         
-        await db.publications.insert_many(publications)
+        await db.publications.insert_many([with_author_fields(pub) for pub in publications])
+        await sync_author_index(db)
         
         # Seed news
         news = [
             {
                 "title": "Joined University of Cambridge",
                 "content": "Started as Research Associate at the Department of Engineering, University of Cambridge.",
-                "date": "2024-04-01",
+                "date": datetime(2024, 4, 1, tzinfo=timezone.utc),
                 "category": "career"
             }
         ]
         
         await db.news.insert_many(news)
+        await ensure_news_indexes()
+        invalidate_news_feed()
         
         return {"success": True, "message": "Database seeded successfully!"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error seeding database: {str(e)}")
 
 
+# Opt-in profiling: requests carrying X-Profile-Token, plus a PROFILE_SAMPLE_RATE fraction of traffic
+app.add_middleware(
+    ProfilingMiddleware,
+    token=os.environ.get('PROFILE_TOKEN'),
+    sample_rate=float(os.environ.get('PROFILE_SAMPLE_RATE', '0')),
+    output_dir=Path(os.environ.get('PROFILE_DIR', ROOT_DIR / 'profiles')),
+)
+
+# Structured access logs; 2xx reads are sampled, errors and slow requests are always logged
+app.add_middleware(
+    AccessLogMiddleware,
+    sample_rate=float(os.environ.get('ACCESS_LOG_SAMPLE_RATE', '1.0')),
+    slow_ms=float(os.environ.get('ACCESS_LOG_SLOW_MS', '1000')),
+)
+
 # Add CORS middleware BEFORE including router
 app.add_middleware(
     CORSMiddleware,
@@ -361,18 +625,43 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link"],
 )
 
 # Include the router in the main app
 app.include_router(api_router)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; records are handed to a queue and written by a listener thread
+log_listener = setup_logging(logging.INFO)
 logger = logging.getLogger(__name__)
 
+async def ensure_news_indexes():
+    # Legacy documents stored the date as an ISO string; convert them so sorting and ranges work
+    async for item in db.news.find({"date": {"$type": "string"}}, {"date": 1}):
+        date = datetime.fromisoformat(item["date"])
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        await db.news.update_one({"_id": item["_id"]}, {"$set": {"date": date}})
+    await db.news.create_index([("date", -1), ("_id", -1)])
+    await db.news.create_index([("category", 1), ("date", -1), ("_id", -1)])
+
+@app.on_event("startup")
+async def create_indexes():
+    try:
+        await ensure_news_indexes()
+        await db.contact_messages.create_index([("notification.status", 1), ("notification.next_attempt_at", 1)])
+        await sync_author_index(db)
+    except Exception as e:
+        logger.warning(f"Could not prepare indexes: {str(e)}")
+
+@app.on_event("startup")
+async def start_notification_workers():
+    if notification_outbox:
+        notification_outbox.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if notification_outbox:
+        await notification_outbox.stop()
     client.close()
+    log_listener.stop()
@@ -137,6 +137,45 @@ class AcademicWebsiteAPITester:
         
         return success
 
+    def test_publications_filter_by_author(self):
+        """Test publications API with author filter"""
+        success, response = self.run_test(
+            "Publications API (Author Filter)",
+            "GET",
+            "publications?author=chakraborty-n",
+            200
+        )
+        
+        if success and isinstance(response, list):
+            print(f"   Publications with N. Chakraborty: {len(response)}")
+        
+        return success
+
+    def test_authors_api(self):
+        """Test author index endpoints"""
+        success, response = self.run_test(
+            "Authors API",
+            "GET",
+            "authors",
+            200
+        )
+        
+        if success and isinstance(response, list) and response:
+            print(f"   Authors Count: {len(response)}")
+            top_author = response[0]
+            detail_success, detail = self.run_test(
+                "Author Detail API",
+                "GET",
+                f"authors/{top_author.get('key')}",
+                200,
+                expected_fields=["key", "name", "publication_count", "coauthors"]
+            )
+            if detail_success and detail:
+                print(f"   {detail.get('name')} Coauthors: {len(detail.get('coauthors', []))}")
+            success = success and detail_success
+        
+        return success
+
     def test_news_api(self):
         """Test news API endpoint"""
         success, response = self.run_test(
@@ -154,6 +193,95 @@ class AcademicWebsiteAPITester:
         
         return success
 
+    def test_news_filters(self):
+        """Test news API with date range, category and limit"""
+        success, response = self.run_test(
+            "News API (Range + Category Filter)",
+            "GET",
+            "news?since=2020-01-01&until=2030-01-01&category=career&limit=5",
+            200
+        )
+        
+        if success and isinstance(response, list):
+            print(f"   Career News Items Count: {len(response)}")
+        
+        return success
+
+    def test_news_pagination(self):
+        """Test news API keyset pagination"""
+        success, response = self.run_test(
+            "News API (Pagination)",
+            "GET",
+            "news?limit=1",
+            200
+        )
+        
+        if success and isinstance(response, list):
+            print(f"   First Page Count: {len(response)}")
+            if len(response) > 1:
+                print("⚠️  Warning: limit was not applied")
+        
+        return success
+
+    def test_news_feeds(self):
+        """Test Atom/RSS feeds and conditional GET"""
+        all_passed = True
+        for name, endpoint, marker in [("Atom", "news/feed.atom", "<feed"), ("RSS", "news/feed.rss", "<rss")]:
+            self.tests_run += 1
+            url = f"{self.api_url}/{endpoint}"
+            print(f"\n🔍 Testing News {name} Feed...")
+            print(f"   URL: {url}")
+            try:
+                response = requests.get(url, timeout=10)
+                etag = response.headers.get("ETag")
+                revalidated = requests.get(url, headers={"If-None-Match": etag or ""}, timeout=10)
+                success = response.status_code == 200 and marker in response.text and revalidated.status_code == 304
+                if success:
+                    self.tests_passed += 1
+                    print(f"✅ Passed - ETag: {etag}, revalidation status: {revalidated.status_code}")
+                    self.test_results.append({"test": f"News {name} Feed", "status": "PASSED", "response_code": response.status_code})
+                else:
+                    print(f"❌ Failed - Status: {response.status_code}, revalidation status: {revalidated.status_code}")
+                    self.test_results.append({"test": f"News {name} Feed", "status": "FAILED", "response_code": response.status_code})
+            except requests.exceptions.RequestException as e:
+                success = False
+                print(f"❌ Failed - Network Error: {str(e)}")
+                self.test_results.append({"test": f"News {name} Feed", "status": "FAILED", "error": f"Network Error: {str(e)}"})
+            all_passed = all_passed and success
+        
+        return all_passed
+
+    def test_bootstrap_api(self):
+        """Test combined bootstrap endpoint"""
+        success, response = self.run_test(
+            "Bootstrap API",
+            "GET",
+            "bootstrap",
+            200,
+            expected_fields=["profile", "publications", "news"]
+        )
+        
+        if success and response:
+            print(f"   Publications Count: {len(response.get('publications', []))}")
+            print(f"   News Items Count: {len(response.get('news', []))}")
+        
+        return success
+
+    def test_bootstrap_sections(self):
+        """Test bootstrap endpoint with section selection"""
+        success, response = self.run_test(
+            "Bootstrap API (Section Selection)",
+            "GET",
+            "bootstrap?sections=profile",
+            200,
+            expected_fields=["profile"]
+        )
+        
+        if success and response:
+            print(f"   Sections Returned: {', '.join(response.keys())}")
+        
+        return success
+
     def test_contact_api(self):
         """Test contact form submission"""
         test_message = {
@@ -177,6 +305,29 @@ class AcademicWebsiteAPITester:
         
         return success
 
+    def test_contact_duplicate(self):
+        """Test that a replayed contact submission is still acknowledged"""
+        test_message = {
+            "name": "Test User",
+            "email": "test@example.com",
+            "subject": "Duplicate Test",
+            "message": f"Duplicate submission check {datetime.now().isoformat()}"
+        }
+        
+        success = True
+        for attempt in ("first", "replayed"):
+            attempt_success, _ = self.run_test(
+                f"Contact Form Submission ({attempt})",
+                "POST",
+                "contact",
+                200,
+                data=test_message,
+                expected_fields=["success", "message"]
+            )
+            success = success and attempt_success
+        
+        return success
+
     def test_cv_download_api(self):
         """Test CV download endpoint"""
         success, _ = self.run_test(
@@ -228,8 +379,16 @@ def main():
         tester.test_publications_api,
         tester.test_publications_filter_by_year,
         tester.test_publications_filter_by_type,
+        tester.test_publications_filter_by_author,
+        tester.test_authors_api,
         tester.test_news_api,
+        tester.test_news_filters,
+        tester.test_news_pagination,
+        tester.test_news_feeds,
+        tester.test_bootstrap_api,
+        tester.test_bootstrap_sections,
         tester.test_contact_api,
+        tester.test_contact_duplicate,
         tester.test_cv_download_api
     ]
     
@@ -35,6 +35,7 @@ function App() {
   const [publications, setPublications] = useState([]);
   const [filteredPublications, setFilteredPublications] = useState([]);
   const [news, setNews] = useState([]);
+  const [newsCursor, setNewsCursor] = useState(null);
   const [searchTerm, setSearchTerm] = useState("");
   const [yearFilter, setYearFilter] = useState("all");
   const [typeFilter, setTypeFilter] = useState("all");
@@ -42,9 +43,7 @@ function App() {
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false);
 
   useEffect(() => {
-    fetchProfile();
-    fetchPublications();
-    fetchNews();
+    fetchBootstrap();
   }, []);
 
   useEffect(() => {
@@ -52,28 +51,23 @@ function App() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [publications, searchTerm, yearFilter, typeFilter]);
 
-  const fetchProfile = async () => {
+  const fetchBootstrap = async () => {
     try {
-      const response = await axios.get(`${API}/profile`);
-      setProfile(response.data);
+      const response = await axios.get(`${API}/bootstrap`);
+      setProfile(response.data.profile);
+      setPublications(response.data.publications);
+      setNews(response.data.news);
+      setNewsCursor(response.data.news_next_cursor);
     } catch (error) {
-      console.error("Error fetching profile:", error);
+      console.error("Error fetching site data:", error);
     }
   };
 
-  const fetchPublications = async () => {
+  const loadMoreNews = async () => {
     try {
-      const response = await axios.get(`${API}/publications`);
-      setPublications(response.data);
-    } catch (error) {
-      console.error("Error fetching publications:", error);
-    }
-  };
-
-  const fetchNews = async () => {
-    try {
-      const response = await axios.get(`${API}/news`);
-      setNews(response.data);
+      const response = await axios.get(`${API}/news`, { params: { cursor: newsCursor } });
+      setNews((current) => [...current, ...response.data]);
+      setNewsCursor(response.headers["x-next-cursor"] || null);
     } catch (error) {
       console.error("Error fetching news:", error);
     }
@@ -587,6 +581,18 @@ function App() {
                 </motion.div>
               ))}
             </div>
+            {newsCursor && (
+              <div className="mt-12 text-center">
+                <Button
+                  onClick={loadMoreNews}
+                  variant="outline"
+                  className="bg-transparent border border-slate-200 text-slate-900 px-8 py-6 text-sm font-mono uppercase tracking-widest hover:bg-slate-50 transition-all duration-300 rounded-none"
+                  data-testid="news-load-more-button"
+                >
+                  Load More
+                </Button>
+              </div>
+            )}
           </motion.div>
         </div>
       </section>
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Backend modules are imported the way uvicorn runs them, from the backend directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
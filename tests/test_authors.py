@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from authors import AmbiguousAuthor, UnknownAuthor, author_key, build_author_index, parse_authors, resolve_author_key, sync_author_index
+
+
+def test_parse_authors_normalizes_names():
+    parsed = parse_authors("Sanjeev Kumar Ghai, S. K. Ghai & M. J. Cleary and Jean-Luc Picard")
+    assert parsed == [
+        {"key": "ghai-sk", "name": "S. K. Ghai"},
+        {"key": "cleary-mj", "name": "M. J. Cleary"},
+        {"key": "picard-jl", "name": "J. L. Picard"},
+    ]
+    assert author_key("N. Chakraborty") == "chakraborty-n"
+    assert author_key("chakraborty-n") == "chakraborty-n"
+
+
+def test_build_author_index_counts_coauthors():
+    index = {author["key"]: author for author in build_author_index([
+        {"authors": "S. K. Ghai, S. De"},
+        {"authors": "S. K. Ghai, U. Ahmed, N. Chakraborty"},
+        {"authors": "U. Ahmed, S. K. Ghai"},
+    ])}
+    assert index["ghai-sk"]["publication_count"] == 3
+    assert index["ghai-sk"]["coauthors"][0] == {"key": "ahmed-u", "name": "U. Ahmed", "count": 2}
+    assert [edge["key"] for edge in index["de-s"]["coauthors"]] == ["ghai-sk"]
+
+
+def test_sync_and_resolve_against_mongo():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    db = mongomock_motor.AsyncMongoMockClient()["test"]
+
+    async def run():
+        await db.publications.insert_many([
+            {"title": "A", "authors": "S. K. Ghai, S. De"},
+            {"title": "B", "authors": "S. K. Ghai, A. De, A. Kronenburg"},
+        ])
+        await sync_author_index(db)
+        first = sorted([author["key"] async for author in db.authors.find({})])
+
+        # Re-syncing after a publication is removed drops only the stale author
+        await db.publications.delete_one({"title": "B"})
+        await sync_author_index(db)
+        second = sorted([author["key"] async for author in db.authors.find({})])
+        await sync_author_index(db)
+        third = sorted([author["key"] async for author in db.authors.find({})])
+
+        resolved = await resolve_author_key(db, "Ghai")
+        with pytest.raises(UnknownAuthor):
+            await resolve_author_key(db, "Nobody")
+        return first, second, third, resolved
+
+    first, second, third, resolved = asyncio.run(run())
+    assert first == ["de-a", "de-s", "ghai-sk", "kronenburg-a"]
+    assert second == third == ["de-s", "ghai-sk"]
+    assert resolved == "ghai-sk"
+
+
+def test_surname_matching_several_authors_is_ambiguous():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    db = mongomock_motor.AsyncMongoMockClient()["test"]
+
+    async def run():
+        await db.authors.insert_many([{"key": "de-s"}, {"key": "de-a"}])
+        await resolve_author_key(db, "De")
+
+    with pytest.raises(AmbiguousAuthor, match="Ambiguous"):
+        asyncio.run(run())
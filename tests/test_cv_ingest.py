@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+from cv_ingest import CV_PATH, ingest, parse_entry, split_entries, title_key, title_similarity
+
+CV_TEXT = "\n".join([
+    "References and other text before the list are ignored",
+    "Journal Publications",
+    "1. Sanjeev Kumar Ghai, Santanu De, Numerical investigation of flow and scalar fields of piloted, partially-",
+    "premixed dimethyl ether/air jet flames using stochastic multiple mapping conditioning approach,",
+    "Combustion and Flame , 208, 2019, 480-491.",
+    "2. Sanjeev Kr. Ghai, Umair Ahmed, Nilanjan Chakraborty & Markus Klein, Energy integral equation",
+    "for premixed flame-wall interaction. International Journal of Heat and Mass Transfer , 196,",
+    "2022, 123230.",
+    "4",
+    "3. Sanjeev Kr. Ghai, Umair Ahmed, Nilanjan Chakraborty, Modelling of Flame Surface Density, Combustion Science and",
+    "Technology, 2024 (Article in press), https://doi.org/10.1080/00102202.2024.2326649.",
+    "Under submission or preparation",
+    "4. Nilanjan Chakraborty, Sanjeev Kr. Ghai, Umair Ahmed, Effects of fuel Lewis number on turbulent",
+    "flow statistics in oblique-wall quenching,",
+    "(to be submitted).",
+    "Conference Presentations",
+    "1. Sanjeev Kumar Ghai & Santanu De, Numerical modelling of turbulent premixed combustion using",
+    "RANS based stochastic multiple mapping conditioning approach 37th International symposium on",
+    "combustion, Dublin Ireland, 2018.",
+    "2. N Chakraborty, U Ahmed, Sanjeev Kr. Ghai, Premixed flame-wall interaction and heat transfer",
+    "characteristics: Insights based on Direct Numerical Simulations Pages",
+    "23-35, Proceedings of CONV-22: Int. Symp. on Convective Heat and Mass Transfer, June 5 – 10,",
+    "2022, Turkey.",
+    "Book Chapters",
+    "1. Sanjeev Kumar Ghai, Santanu De, Konstantina Vogiatzaki, Matthew J. Cleary. Theory and Appli-",
+    "cation of Multiple Mapping Conditioning for Turbulent Reactive Flows, published in Modeling and",
+    "Simulation of Turbulent Combustion , 447-474, Springer (2018).",
+    "Short Courses and Workshops Attended",
+    "1. Not a publication, 2015.",
+])
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    return [parse_entry(section, entry) for section, entry in split_entries(CV_TEXT)]
+
+
+def test_split_entries_follows_sections(parsed):
+    entries = split_entries(CV_TEXT)
+    assert [section for section, _ in entries] == [
+        "Journal Publications", "Journal Publications", "Journal Publications",
+        "Under submission or preparation", "Conference Presentations", "Conference Presentations", "Book Chapters",
+    ]
+    # Page numbers are dropped and short hyphenation fragments are rejoined
+    assert "123230" in entries[1][1] and " 4 " not in entries[1][1]
+    assert "Theory and Application" in entries[6][1]
+
+
+def test_journal_entries(parsed):
+    first, second, third = parsed[:3]
+    assert first["title"] == ("Numerical investigation of flow and scalar fields of piloted, partially-premixed "
+                              "dimethyl ether/air jet flames using stochastic multiple mapping conditioning approach")
+    assert (first["journal"], first["year"], first["authors"]) == ("Combustion and Flame", 2019, "S. K. Ghai, S. De")
+    assert second["title"] == "Energy integral equation for premixed flame-wall interaction"
+    assert second["journal"] == "International Journal of Heat and Mass Transfer"
+    assert second["authors"] == "S. K. Ghai, U. Ahmed, N. Chakraborty, M. Klein"
+    assert (third["journal"], third["status"], third["year"]) == ("Combustion Science and Technology", "in press", 2024)
+
+
+def test_undated_submission_has_no_year(parsed):
+    submission = parsed[3]
+    assert (submission["type"], submission["status"]) == ("submitted", "under submission")
+    assert submission["year"] is None
+    assert submission["title"].endswith("oblique-wall quenching")
+
+
+def test_conference_venue_run_into_title(parsed):
+    conference = parsed[4]
+    assert conference["title"].endswith("multiple mapping conditioning approach")
+    assert conference["journal"] == "37th International symposium on combustion, Dublin Ireland"
+    assert conference["year"] == 2018
+
+
+def test_conference_page_range_is_not_title(parsed):
+    conference = parsed[5]
+    assert conference["title"].endswith("Insights based on Direct Numerical Simulations")
+    assert conference["journal"].startswith("Proceedings of CONV-22")
+    assert conference["authors"] == "N. Chakraborty, U. Ahmed, S. K. Ghai"
+
+
+def test_book_chapter_author_with_middle_initial(parsed):
+    chapter = parsed[6]
+    assert chapter["authors"] == "S. K. Ghai, S. De, K. Vogiatzaki, M. J. Cleary"
+    assert chapter["title"] == "Theory and Application of Multiple Mapping Conditioning for Turbulent Reactive Flows"
+    assert (chapter["journal"], chapter["year"]) == ("Modeling and Simulation of Turbulent Combustion", 2018)
+
+
+def test_reingests_after_reseed_and_keeps_existing_years():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    db = mongomock_motor.AsyncMongoMockClient()["test"]
+    submission = "Stabilization of lifted dimethyl ether jet diffusion flames in vitiated coflow using MMC-LES"
+
+    async def run():
+        await db.publications.insert_one({"title": submission, "authors": "S. K. Ghai", "year": 2025,
+                                          "type": "journal", "status": "under submission"})
+        first = await ingest(db, CV_PATH)
+        skipped = await ingest(db, CV_PATH)
+        year = (await db.publications.find_one({"title": submission}))["year"]
+        # Wipe the publications as a reseed would, leaving the stored CV hash behind
+        await db.publications.delete_many({})
+        after_wipe = await ingest(db, CV_PATH)
+        return first, skipped, year, after_wipe, await db.publications.count_documents({"source": "cv"})
+
+    first, skipped, year, after_wipe, cv_documents = asyncio.run(run())
+    assert not first["skipped"] and skipped["skipped"]
+    assert year == 2025
+    assert not after_wipe["skipped"]
+    assert cv_documents == after_wipe["parsed"]
+
+
+def test_title_similarity_matches_shortened_titles():
+    full = ("Energy integral equation for premixed flame-wall interaction in turbulent boundary layers "
+            "and its application to turbulent burning velocity and wall flux evaluations")
+    assert title_similarity("Energy integral equation for premixed flame-wall interaction in turbulent boundary layers",
+                            full) >= 0.9
+    assert title_similarity(
+        "Anisotropy of Reynolds stresses in lean H2-air flames in different regimes of turbulent premixed combustion",
+        "Anisotropy of Reynolds stresses and their dissipation rates in lean H2-air flames in different regimes of "
+        "turbulent premixed combustion",
+    ) >= 0.85
+    assert title_similarity(
+        "Effects of fuel Lewis number on wall heat transfer during oblique flame-wall interaction",
+        "Effects of fuel Lewis number on turbulent flow statistics in oblique-wall quenching",
+    ) < 0.85
+
+
+def test_ingest_after_seed_leaves_no_duplicates(monkeypatch):
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    import seed_data
+
+    client = mongomock_motor.AsyncMongoMockClient()
+    monkeypatch.setenv("MONGO_URL", "mongodb://localhost")
+    monkeypatch.setenv("DB_NAME", "test")
+    monkeypatch.setattr(seed_data, "AsyncIOMotorClient", lambda *args, **kwargs: client)
+    db = client["test"]
+
+    async def run():
+        await seed_data.seed_database()
+        await db.publications.insert_one({"title": "Hand-written entry that is not in the CV", "authors": "S. K. Ghai",
+                                          "year": 2020, "type": "journal"})
+        summary = await ingest(db, CV_PATH)
+        return summary, await db.publications.find({}).to_list(None)
+
+    summary, documents = asyncio.run(run())
+    keys = [(document["type"], title_key(document["title"])) for document in documents]
+    assert len(keys) == len(set(keys)) == summary["parsed"]
+    assert all(document.get("source") == "cv" for document in documents)
+    assert summary["retired"] == ["Hand-written entry that is not in the CV"]
@@ -0,0 +1,75 @@
+import dedup
+from dedup import RotatingFingerprintSet, contact_fingerprint
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fingerprint_set(monkeypatch, **options):
+    clock = FakeClock()
+    monkeypatch.setattr(dedup.time, "monotonic", clock)
+    return RotatingFingerprintSet(**options), clock
+
+
+def test_fingerprint_ignores_case_and_whitespace():
+    original = contact_fingerprint("Test@Example.com", "Hello  there", "Line one\n  line two ")
+    replay = contact_fingerprint(" test@example.com", "hello there", "LINE ONE line two")
+    assert original == replay
+
+
+def test_fingerprint_distinguishes_fields():
+    assert contact_fingerprint("a@b.com", "subject", "message") != contact_fingerprint("a@b.com", "subject", "other")
+    # Field boundaries matter: moving text between fields is a different submission
+    assert contact_fingerprint("a@b.com", "ab", "c") != contact_fingerprint("a@b.com", "a", "bc")
+
+
+def test_duplicate_within_window(monkeypatch):
+    seen, clock = _fingerprint_set(monkeypatch, window=60)
+    assert seen.check_and_add(b"one") is False
+    clock.now += 30
+    assert seen.check_and_add(b"one") is True
+
+
+def test_fingerprint_survives_one_rotation_then_expires(monkeypatch):
+    seen, clock = _fingerprint_set(monkeypatch, window=60)
+    seen.check_and_add(b"one")
+
+    clock.now += 61  # rotated once: still in the previous generation
+    assert seen.check_and_add(b"two") is False
+    assert seen.check_and_add(b"one") is True
+
+    clock.now += 61  # rotated again: "one" was only in the dropped generation
+    assert seen.check_and_add(b"one") is False
+
+
+def test_idle_for_two_windows_clears_everything(monkeypatch):
+    seen, clock = _fingerprint_set(monkeypatch, window=60)
+    seen.check_and_add(b"one")
+    clock.now += 121
+    assert seen.check_and_add(b"two") is False
+    assert len(seen) == 1
+
+
+def test_size_cap_rotates_early(monkeypatch):
+    seen, _ = _fingerprint_set(monkeypatch, window=3600, max_size=2)
+    for fingerprint in (b"a", b"b", b"c", b"d", b"e"):
+        seen.check_and_add(fingerprint)
+    # Never more than two generations of at most max_size entries each
+    assert len(seen) <= 4
+    assert seen.check_and_add(b"a") is False
+
+
+def test_discard_allows_retry(monkeypatch):
+    seen, clock = _fingerprint_set(monkeypatch, window=60)
+    seen.check_and_add(b"one")
+    seen.discard(b"one")
+    assert seen.check_and_add(b"one") is False
+
+    clock.now += 61
+    seen.discard(b"one")  # also removed from the previous generation
+    assert seen.check_and_add(b"one") is False
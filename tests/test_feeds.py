@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from bson import decode, encode
+from bson.codec_options import CodecOptions
+
+from feeds import build_atom, build_rss, last_updated, news_fingerprint, record_fingerprint
+
+
+def _from_mongo(items):
+    """Round-trip documents through BSON the way motor returns them with tz_aware=True"""
+    options = CodecOptions(tz_aware=True)
+    return [decode(encode(item), codec_options=options) for item in items]
+
+
+NEWS = [
+    {"title": "Joined University of Cambridge", "content": "Research Associate & more", "category": "career",
+     "date": datetime(2024, 4, 1, tzinfo=timezone.utc)},
+    {"title": "Award", "content": "2nd Prize", "category": "award", "date": datetime(2022, 9, 15, tzinfo=timezone.utc)},
+]
+
+
+def test_tz_aware_mongo_dates_format_as_gmt():
+    news_items = _from_mongo(NEWS)
+    assert news_items[0]["date"].tzinfo is not timezone.utc
+
+    updated = last_updated(news_items)
+    assert updated.tzinfo is timezone.utc
+    assert format_datetime(updated, usegmt=True) == "Mon, 01 Apr 2024 00:00:00 GMT"
+
+
+def test_feeds_render_mongo_documents():
+    news_items = _from_mongo(NEWS)
+    atom = build_atom(news_items, "https://example.org", "https://example.org/api/news/feed.atom")
+    rss = build_rss(news_items, "https://example.org", "https://example.org/api/news/feed.rss")
+
+    assert "<updated>2024-04-01T00:00:00+00:00</updated>" in atom
+    assert "Research Associate &amp; more" in atom
+    assert "<pubDate>Thu, 15 Sep 2022 00:00:00 +0000</pubDate>" in rss
+
+
+def test_fingerprint_changes_with_content():
+    edited = [dict(NEWS[0]), dict(NEWS[1], content="1st Prize")]
+    assert news_fingerprint(NEWS) == news_fingerprint([dict(item) for item in NEWS])
+    assert news_fingerprint(NEWS) != news_fingerprint(edited)
+
+
+def test_recorded_change_time_survives_restarts():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["feed_state"]
+    changed_at = datetime(2024, 4, 1, 12, 0, tzinfo=timezone.utc)
+
+    async def run():
+        await collection.insert_one({"_id": "news", "fingerprint": "first", "changed_at": changed_at})
+        # A restarted or second instance seeing the same content reports the stored time
+        unchanged = await record_fingerprint(collection, "first")
+        edited = await record_fingerprint(collection, "second")
+        again = await record_fingerprint(collection, "second")
+        return unchanged, edited, again
+
+    unchanged, edited, again = asyncio.run(run())
+    assert unchanged == changed_at
+    assert edited > changed_at and edited.tzinfo is timezone.utc
+    assert again == edited
+
+
+def test_first_fingerprint_is_recorded():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["feed_state"]
+
+    async def run():
+        recorded = await record_fingerprint(collection, "first")
+        return recorded, await collection.count_documents({}), await record_fingerprint(collection, "first")
+
+    recorded, count, again = asyncio.run(run())
+    assert count == 1 and recorded == again
@@ -0,0 +1,96 @@
+import asyncio
+import socket
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+from notifications import DEAD, PENDING, SENT, NotificationOutbox, pending_notification  # noqa: E402
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.messages = []
+        self.sessions = set()
+
+    async def handle_DATA(self, server, session, envelope):
+        self.sessions.add(id(session))
+        self.messages.append(envelope.content.decode("utf-8"))
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+def _contact(index: int) -> dict:
+    return {"name": "Test User", "email": "test@example.com", "subject": f"Subject {index}",
+            "message": "Hello", "timestamp": "2024-01-01T00:00:00+00:00", "notification": pending_notification()}
+
+
+def _outbox(port: int, **options) -> NotificationOutbox:
+    collection = mongomock_motor.AsyncMongoMockClient()["test"]["contact_messages"]
+    return NotificationOutbox(collection, "127.0.0.1", port, sender="site@example.com",
+                              recipient="me@example.com", **options)
+
+
+def test_batch_is_delivered_over_one_connection(smtp_server):
+    controller, handler = smtp_server
+    outbox = _outbox(controller.port, batch_size=10)
+
+    async def run():
+        # A message stored without delivery state (notifications were disabled) is never sent
+        await outbox.collection.insert_one({key: value for key, value in _contact(9).items() if key != "notification"})
+        await outbox.collection.insert_many([_contact(index) for index in range(3)])
+        assert await outbox.process_batch() == 3
+        assert await outbox.process_batch() == 0
+        return [entry["notification"] async for entry in outbox.collection.find({"notification": {"$exists": True}})]
+
+    notifications = asyncio.run(run())
+    assert [notification["status"] for notification in notifications] == [SENT] * 3
+    # Sent messages keep only their final state, so they drop out of the due-entry queries
+    assert all("sent_at" in notification and "next_attempt_at" not in notification for notification in notifications)
+    assert len(handler.messages) == 3
+    assert len(handler.sessions) == 1
+    assert "Subject: [Website contact] Subject 0" in handler.messages[0]
+    assert "Reply-To: test@example.com" in handler.messages[0]
+
+
+def test_failures_back_off_then_move_to_dead_letter():
+    outbox = _outbox(_free_port(), base_delay=10, max_delay=15, max_attempts=3)
+
+    async def attempt():
+        await outbox.process_batch()
+        entry = (await outbox.collection.find_one({}))["notification"]
+        # Make the entry due again without waiting out the backoff
+        await outbox.collection.update_one({}, {"$set": {"notification.next_attempt_at": datetime.now(timezone.utc)}})
+        return entry
+
+    async def run():
+        await outbox.collection.insert_one(_contact(0))
+        return [await attempt() for _ in range(3)]
+
+    started = datetime.now(timezone.utc).replace(tzinfo=None)
+    first, second, third = asyncio.run(run())
+
+    assert (first["status"], first["attempts"]) == (PENDING, 1)
+    assert first["next_attempt_at"] - started >= timedelta(seconds=10)
+    assert (second["status"], second["attempts"]) == (PENDING, 2)
+    assert second["next_attempt_at"] - started >= timedelta(seconds=15)
+    assert second["next_attempt_at"] - started < timedelta(seconds=20)  # capped at max_delay
+    assert (third["status"], third["attempts"]) == (DEAD, 3)
+    assert third["last_error"].startswith("connect:")
+    assert "next_attempt_at" not in third